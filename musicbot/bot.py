@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import Any
@@ -10,7 +11,7 @@ import wavelink
 import xxhash
 from discord import app_commands
 
-from .commands import APP_COMMANDS
+from .commands import get_app_commands
 from .utils import (
     LavalinkCreds,
     MusicBotError,
@@ -21,8 +22,15 @@ from .utils import (
 
 _log = logging.getLogger(__name__)
 
+# Pre-bound to skip the module attribute lookups in the hashing path.
+_json_dumps = json.dumps
+_xxh3_64 = xxhash.xxh3_64
+
 platformdir_info = platformdirs.PlatformDirs("discord-musicbot", "Sachaa-Thanasius", roaming=False)
 
+# The cache location is process-invariant, so resolve (and create if necessary) the hash file once at import.
+_TREE_HASH_PATH = resolve_path_with_links(platformdir_info.user_cache_path / "musicbot_tree.hash")
+
 
 class VersionableTree(app_commands.CommandTree):
     """A custom command tree to handle autosyncing and save command mentions.
@@ -37,15 +45,22 @@ class VersionableTree(app_commands.CommandTree):
     def __init__(self, client: MusicBot, *, fallback_to_global: bool = True) -> None:
         super().__init__(client, fallback_to_global=fallback_to_global)
         self.application_commands: dict[int | None, list[app_commands.AppCommand]] = {}
+        # Built lazily on first /help; the command set is fixed after setup_hook, so once is enough.
+        self.help_embed: discord.Embed | None = None
 
     async def on_error(self, itx: discord.Interaction, error: app_commands.AppCommandError, /) -> None:
         if isinstance(error, MusicBotError):
-            if not itx.response.is_done():
-                await itx.response.send_message(error.message)
-            else:
-                await itx.followup.send(error.message)
+            message = error.message
+        elif isinstance(error, app_commands.CommandOnCooldown):
+            message = f"You're doing that too fast. Try again in {error.retry_after:.1f} seconds."
         else:
             await super().on_error(itx, error)
+            return
+
+        if not itx.response.is_done():
+            await itx.response.send_message(message)
+        else:
+            await itx.followup.send(message)
 
     async def sync(self, *, guild: discord.abc.Snowflake | None = None) -> list[app_commands.AppCommand]:
         ret = await super().sync(guild=guild)
@@ -115,18 +130,25 @@ class VersionableTree(app_commands.CommandTree):
 
         return f"</{_command.qualified_name}:{app_command_found.id}>"
 
-    async def get_hash(self) -> bytes:
+    async def get_hash(self) -> int:
         """Generate a unique hash to represent all commands currently in the tree."""
 
         tree_commands = sorted(self._get_all_commands(guild=None), key=lambda c: c.qualified_name)
 
         translator = self.translator
         if translator:
-            payload = [await command.get_translated_payload(self, translator) for command in tree_commands]
+            # Translation may involve IO, so resolve all of the payloads concurrently.
+            payload = await asyncio.gather(
+                *(command.get_translated_payload(self, translator) for command in tree_commands)
+            )
         else:
             payload = [command.to_dict(self) for command in tree_commands]
 
-        return xxhash.xxh3_64_digest(json.dumps(payload).encode("utf-8"), seed=1)
+        # Feed the hasher per command instead of serializing everything into one large intermediate blob.
+        hasher = _xxh3_64(seed=1)
+        for command_payload in payload:
+            hasher.update(_json_dumps(command_payload).encode("utf-8"))
+        return hasher.intdigest()
 
     async def sync_if_commands_updated(self) -> None:
         """Sync the tree globally if its commands are different from the tree's most recent previous version.
@@ -140,15 +162,19 @@ class VersionableTree(app_commands.CommandTree):
         """
 
         tree_hash = await self.get_hash()
-        tree_hash_path = platformdir_info.user_cache_path / "musicbot_tree.hash"
-        tree_hash_path = resolve_path_with_links(tree_hash_path)
-        with tree_hash_path.open("r+b") as fp:
-            data = fp.read()
-            if data != tree_hash:
-                _log.info("New version of the command tree. Syncing now.")
-                await self.sync()
-                fp.seek(0)
-                fp.write(tree_hash)
+        try:
+            data = _TREE_HASH_PATH.read_bytes()
+        except FileNotFoundError:
+            data = b""
+
+        # An empty or missing hash file reads as 0, which no xxh3 seed-1 digest of the tree should collide with.
+        if int.from_bytes(data, "little") != tree_hash:
+            _log.info("New version of the command tree. Syncing now.")
+            await self.sync()
+            # Write-then-rename so a crash mid-write can't leave a torn hash that suppresses the next sync.
+            temp_path = _TREE_HASH_PATH.with_suffix(".tmp")
+            temp_path.write_bytes(tree_hash.to_bytes(8, "little"))
+            temp_path.replace(_TREE_HASH_PATH)
 
 
 class MusicBot(discord.AutoShardedClient):
@@ -174,7 +200,14 @@ class MusicBot(discord.AutoShardedClient):
         self.tree = VersionableTree(self)
 
     async def on_connect(self) -> None:
-        """(Re)set the client's general invite link every time it (re)connects to the Discord Gateway."""
+        """Set the client's general invite link the first time it connects to the Discord Gateway.
+
+        The link only depends on the application id, so reconnects reuse the cached one instead of re-fetching
+        the application info.
+        """
+
+        if hasattr(self, "invite_link"):
+            return
 
         await self.wait_until_ready()
         data = await self.application_info()
@@ -184,14 +217,15 @@ class MusicBot(discord.AutoShardedClient):
     async def setup_hook(self) -> None:
         """Perform a few operations before the bot connects to the Discord Gateway."""
 
+        # Add the app commands to the tree in one uninterrupted batch before any awaits.
+        add_command = self.tree.add_command
+        for cmd in get_app_commands():
+            add_command(cmd)
+
         # Connect to the Lavalink node that will provide the music.
         node = wavelink.Node(uri=self.config.uri, password=self.config.password, inactive_player_timeout=600)
         await wavelink.Pool.connect(client=self, nodes=[node])
 
-        # Add the app commands to the tree.
-        for cmd in APP_COMMANDS:
-            self.tree.add_command(cmd)
-
         # Sync the tree if it's different from the previous version, using hashing for comparison.
         await self.tree.sync_if_commands_updated()
 
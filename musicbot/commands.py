@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
 import json
+import time
+from collections.abc import Callable, Coroutine
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Concatenate, Literal, ParamSpec, TypeVar, overload
 
 import discord
 import wavelink
@@ -12,19 +17,145 @@ from .utils import (
     MusicPlayer,
     MusicQueueView,
     ShortTime,
+    UnboundCommandCallback,
     create_track_embed,
     ensure_voice_hook,
     is_in_bot_vc,
 )
 
 
+try:
+    import orjson  # type: ignore
+except ModuleNotFoundError:
+    orjson = None
+
+
 if TYPE_CHECKING:
     from .bot import MusicBot
 else:
     MusicBot = discord.AutoShardedClient
 
 
-__all__ = ("APP_COMMANDS",)
+P = ParamSpec("P")
+T = TypeVar("T")
+GroupT = TypeVar("GroupT", bound=app_commands.Group)
+
+# The group-bound analogue of UnboundCommandCallback, for commands defined as methods on an app command group.
+GroupCommandCallback = Callable[Concatenate[GroupT, discord.Interaction[Any], P], Coroutine[Any, Any, T]]
+
+__all__ = ("get_app_commands",)
+
+# The negative-path response shared by every player-dependent command.
+_NO_PLAYER_MSG = "No player to perform this on."
+
+# Shared by every /current invocation with nothing playing; send_message only serializes it, never mutates it.
+_IDLE_EMBED = discord.Embed(color=0x149CDF, title="Now Playing", description="Nothing is playing currently.")
+
+# Source of truth for /loop's options: maps each choice to the queue mode to set and the response to send.
+_LOOP_MODES: dict[str, tuple[wavelink.QueueMode, str]] = {
+    "All Tracks": (wavelink.QueueMode.loop, "Looping over all tracks in the queue until disabled."),
+    "Current Track": (wavelink.QueueMode.loop_all, "Looping the current track until disabled."),
+    "Off": (wavelink.QueueMode.normal, "Reset the looping settings."),
+}
+
+
+# In-flight Lavalink searches keyed by normalized query, so concurrent identical requests share one call.
+_inflight_searches: dict[str, asyncio.Future[wavelink.Search]] = {}
+
+# Recently finished searches, kept for a short window so repeated queries skip the node entirely.
+_search_cache: dict[str, tuple[float, wavelink.Search]] = {}
+_SEARCH_CACHE_TTL = 300.0
+_SEARCH_CACHE_MAX = 256
+
+
+def _finish_search(key: str, future: asyncio.Future[wavelink.Search]) -> None:
+    """Evict a finished search from the in-flight registry and cache its result if it succeeded."""
+
+    _inflight_searches.pop(key, None)
+    if not future.cancelled() and future.exception() is None:
+        if len(_search_cache) >= _SEARCH_CACHE_MAX:
+            # Insertion order tracks recency closely enough here to pick an eviction victim.
+            del _search_cache[next(iter(_search_cache))]
+        _search_cache[key] = (time.monotonic(), future.result())
+
+
+def _fresh_tracks(tracks: wavelink.Search) -> wavelink.Search:
+    """Rebuild search results as fresh objects.
+
+    Cached and coalesced searches would otherwise hand the same objects to every caller, and /play mutates
+    track extras — shared instances would let one user's requester attribution overwrite another's, even
+    for tracks already sitting in a queue.
+    """
+
+    if isinstance(tracks, wavelink.Playlist):
+        return copy.deepcopy(tracks)
+    return [wavelink.Playable(track.raw_data) for track in tracks]
+
+
+async def _search_tracks(query: str) -> wavelink.Search:
+    """Search Lavalink for tracks, coalescing concurrent identical queries into a single request.
+
+    Successful results stick around for a few minutes so that, e.g., picking an autocomplete suggestion
+    doesn't re-run the search that produced it. In-flight entries evict themselves as soon as the underlying
+    search finishes. Every caller gets its own copies of the resulting tracks.
+    """
+
+    # Only strip whitespace: queries are often URLs, and URL paths (e.g. YouTube video ids) are case-sensitive.
+    key = query.strip()
+
+    cached = _search_cache.get(key)
+    if cached is not None:
+        timestamp, tracks = cached
+        if (time.monotonic() - timestamp) < _SEARCH_CACHE_TTL:
+            return _fresh_tracks(tracks)
+        del _search_cache[key]
+
+    future = _inflight_searches.get(key)
+    if future is None:
+        future = asyncio.ensure_future(wavelink.Playable.search(query))
+        _inflight_searches[key] = future
+        future.add_done_callback(functools.partial(_finish_search, key))
+    return _fresh_tracks(await future)
+
+
+def _get_player(itx: discord.Interaction[MusicBot]) -> MusicPlayer | None:
+    """Get the guild's voice client as a typed MusicPlayer, if one is connected.
+
+    Every command here is guild-only and the bot only ever connects with cls=MusicPlayer, so an exact type
+    check suffices and is cheaper than isinstance against a union type.
+    """
+
+    # Known at runtime in guild-only commands.
+    assert itx.guild
+
+    vc = itx.guild.voice_client
+    return vc if type(vc) is MusicPlayer else None
+
+
+@overload
+def defer_first(func: UnboundCommandCallback[P, T]) -> UnboundCommandCallback[P, T]: ...
+@overload
+def defer_first(func: GroupCommandCallback[GroupT, P, T]) -> GroupCommandCallback[GroupT, P, T]: ...
+def defer_first(func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., Coroutine[Any, Any, T]]:
+    """A makeshift pre-command hook that defers the interaction before the command body runs.
+
+    Commands that round-trip to the Lavalink node can exceed Discord's 3 second response deadline; deferring
+    up front trades that for the 15 minute followup window. Wrapped commands must respond via followups.
+
+    This lives here rather than in utils so that wrapped commands' parameter annotations resolve against this
+    module's namespace.
+    """
+
+    @functools.wraps(func)
+    async def callback(*args: Any, **kwargs: Any) -> T:
+        # The interaction is the first argument for free commands and the second for group-bound ones.
+        itx: discord.Interaction[MusicBot] = args[1] if isinstance(args[0], app_commands.Group) else args[0]
+
+        if not itx.response.is_done():
+            await itx.response.defer()
+        return await func(*args, **kwargs)
+
+    return callback
 
 
 @app_commands.command(name="connect")
@@ -40,37 +171,41 @@ async def muse_connect(itx: discord.Interaction[MusicBot], channel: discord.Voic
     """
 
     # Known at runtime.
-    assert itx.guild
     assert isinstance(itx.user, discord.Member)
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
+
+    # Read the voice state once up front; guild_permissions stays lazy since it resolves the member's roles.
+    user_voice = itx.user.voice
+    user_voice_channel = user_voice.channel if user_voice else None
 
-    if vc is not None and itx.user.voice is not None:
+    if vc is not None and user_voice is not None:
         # Not sure in what circumstances a member would have a voice state without being in a valid channel.
-        target_channel = channel or itx.user.voice.channel
-        if target_channel != vc.channel:
-            if itx.user.guild_permissions.administrator:
-                await vc.move_to(target_channel)
-                await itx.response.send_message(f"Joined the {target_channel} channel.")
-            else:
-                await itx.response.send_message("Voice player is currently being used in another channel.")
+        target_channel = channel or user_voice_channel
+        if target_channel == vc.channel:
+            message = "Voice player already connected to this voice channel."
+        elif itx.user.guild_permissions.administrator:
+            await vc.move_to(target_channel)
+            message = f"Joined the {target_channel} channel."
         else:
-            await itx.response.send_message("Voice player already connected to this voice channel.")
-    elif itx.user.voice is None:
-        if itx.user.guild_permissions.administrator and channel is not None:
+            message = "Voice player is currently being used in another channel."
+    elif user_voice is None:
+        if channel is not None and itx.user.guild_permissions.administrator:
             await channel.connect(cls=MusicPlayer)
-            await itx.response.send_message(f"Joined the {channel} channel.")
+            message = f"Joined the {channel} channel."
         else:
-            await itx.response.send_message("Please join a voice channel and try again.")
+            message = "Please join a voice channel and try again."
     else:
         # Not sure in what circumstances a member would have a voice state without being in a valid channel.
-        assert itx.user.voice.channel
-        await itx.user.voice.channel.connect(cls=MusicPlayer)
-        await itx.response.send_message(f"Joined the {itx.user.voice.channel} channel.")
+        assert user_voice_channel
+        await user_voice_channel.connect(cls=MusicPlayer)
+        message = f"Joined the {user_voice_channel} channel."
+
+    await itx.response.send_message(message)
 
 
 @app_commands.command(name="play")
 @app_commands.guild_only()
+@app_commands.checks.cooldown(1, 2.0, key=lambda itx: itx.user.id)
 @ensure_voice_hook
 async def muse_play(itx: discord.Interaction[MusicBot], query: str) -> None:
     """Play audio from a YouTube url or search term.
@@ -88,11 +223,13 @@ async def muse_play(itx: discord.Interaction[MusicBot], query: str) -> None:
     vc = itx.guild.voice_client
     assert isinstance(vc, MusicPlayer)  # Known due to ensure_voice_hook.
 
-    await itx.response.defer()
+    queue = vc.queue
 
-    tracks: wavelink.Search = await wavelink.Playable.search(query)
+    # The interaction was already deferred by ensure_voice_hook.
+    tracks: wavelink.Search = await _search_tracks(query)
     if not tracks:
         await itx.followup.send(f"Could not find any tracks based on the given query: `{query}`.")
+        return
 
     if isinstance(tracks, wavelink.Playlist):
         try:
@@ -100,24 +237,29 @@ async def muse_play(itx: discord.Interaction[MusicBot], query: str) -> None:
         except AttributeError:
             tracks.extras = {"requester": itx.user.mention}
 
-        added = await vc.queue.put_wait(tracks)
-        await itx.followup.send(f"Added {added} tracks from the `{tracks.name}` playlist to the queue.")
+        added = await queue.put_wait(tracks)
+        notification = f"Added {added} tracks from the `{tracks.name}` playlist to the queue."
     else:
         track = tracks[0]
         track.extras.requester = itx.user.mention
-        await vc.queue.put_wait(track)
-        await itx.followup.send(f"Added `{track.title}` to the queue.")
+        await queue.put_wait(track)
+        notification = f"Added `{track.title}` to the queue."
 
+    # The notification and starting playback are independent round trips, so overlap them when both apply.
     if not vc.playing:
-        await vc.play(vc.queue.get())
+        await asyncio.gather(itx.followup.send(notification), vc.play(queue.get()))
+    else:
+        await itx.followup.send(notification)
 
 
 @muse_play.autocomplete("query")
 async def muse_play_autocomplete(_: discord.Interaction[MusicBot], current: str) -> list[app_commands.Choice[str]]:
-    if not current:
+    # Discord fires autocomplete per keystroke; don't bother the node with queries too short to rank well.
+    if len(current) < 3:
         return []
-    tracks: wavelink.Search = await wavelink.Playable.search(current)
-    return [app_commands.Choice(name=track.title, value=track.uri or track.title) for track in tracks][:25]
+    tracks: wavelink.Search = await _search_tracks(current)
+    # Slice before constructing: Discord only accepts 25 choices, so don't build ones that get thrown away.
+    return [app_commands.Choice(name=track.title, value=track.uri or track.title) for track in tracks[:25]]
 
 
 @app_commands.command(name="pause")
@@ -126,17 +268,14 @@ async def muse_play_autocomplete(_: discord.Interaction[MusicBot], current: str)
 async def muse_pause(itx: discord.Interaction[MusicBot]) -> None:
     """Pause the audio."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
         pause_changed_status = "Resumed" if vc.paused else "Paused"
         await vc.pause(not vc.paused)
         await itx.response.send_message(f"{pause_changed_status} playback.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.response.send_message(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="resume")
@@ -145,10 +284,7 @@ async def muse_pause(itx: discord.Interaction[MusicBot]) -> None:
 async def muse_resume(itx: discord.Interaction[MusicBot]) -> None:
     """Resume the audio if paused."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
         if vc.paused:
@@ -157,25 +293,23 @@ async def muse_resume(itx: discord.Interaction[MusicBot]) -> None:
         else:
             await itx.response.send_message("The music player is not paused.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.response.send_message(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="stop")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_stop(itx: discord.Interaction[MusicBot]) -> None:
     """Stop playback and disconnect the bot from voice."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
         await vc.disconnect()
-        await itx.response.send_message("Disconnected from voice channel.")
+        await itx.followup.send("Disconnected from voice channel.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="current")
@@ -183,19 +317,9 @@ async def muse_stop(itx: discord.Interaction[MusicBot]) -> None:
 async def muse_current(itx: discord.Interaction[MusicBot]) -> None:
     """Display the current track."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
-
-    if vc and vc.current:
-        current_embed = create_track_embed("Now Playing", vc.current)
-    else:
-        current_embed = discord.Embed(
-            color=0x149CDF,
-            title="Now Playing",
-            description="Nothing is playing currently.",
-        )
+    vc = _get_player(itx)
+    current = vc.current if vc else None
+    current_embed = create_track_embed("Now Playing", current) if current else _IDLE_EMBED
 
     await itx.response.send_message(embed=current_embed)
 
@@ -209,27 +333,29 @@ class MuseQueueGroup(app_commands.Group):
         )
 
     @app_commands.command(name="get")
+    @defer_first
     async def queue_get(self, itx: discord.Interaction[MusicBot]) -> None:
         """Display everything in the queue."""
 
-        # Known at runtime.
-        assert itx.guild
-        vc = itx.guild.voice_client
-        assert isinstance(vc, MusicPlayer | None)
+        vc = _get_player(itx)
 
         queue_embeds: list[discord.Embed] = []
         if vc:
-            if vc.current:
-                current_embed = create_track_embed("Now Playing", vc.current)
+            current = vc.current
+            if current:
+                current_embed = create_track_embed("Now Playing", current)
                 queue_embeds.append(current_embed)
 
             view = MusicQueueView(itx.user.id, list(vc.queue), per=10)
             queue_embeds.append(view.get_first_page())
-            await itx.response.send_message(embeds=queue_embeds, view=view)
-            view.message = await itx.original_response()
+            # followup.send returns the sent message, so there's no need for an extra original_response fetch.
+            view.message = await itx.followup.send(embeds=queue_embeds, view=view, wait=True)
+        else:
+            await itx.followup.send(_NO_PLAYER_MSG)
 
     @app_commands.command(name="remove")
     @is_in_bot_vc()
+    @defer_first
     async def queue_remove(self, itx: discord.Interaction[MusicBot], entry: int) -> None:
         """Remove a track from the queue by position.
 
@@ -241,43 +367,41 @@ class MuseQueueGroup(app_commands.Group):
             The track's position.
         """
 
-        # Known at runtime.
-        assert itx.guild
-        vc = itx.guild.voice_client
-        assert isinstance(vc, MusicPlayer | None)
+        vc = _get_player(itx)
 
         if vc:
-            if entry > len(vc.queue) or entry < 1:
-                await itx.response.send_message("That track does not exist and cannot be removed.")
+            queue = vc.queue
+            if entry > len(queue) or entry < 1:
+                await itx.followup.send("That track does not exist and cannot be removed.")
             else:
-                vc.queue.delete(entry - 1)
-                await itx.response.send_message(f"Removed {entry} from the queue.")
+                queue.delete(entry - 1)
+                await itx.followup.send(f"Removed {entry} from the queue.")
         else:
-            await itx.response.send_message("No player to perform this on.")
+            await itx.followup.send(_NO_PLAYER_MSG)
 
     @app_commands.command(name="clear")
     @is_in_bot_vc()
+    @defer_first
     async def queue_clear(self, itx: discord.Interaction[MusicBot]) -> None:
         """Empty the queue."""
 
-        # Known at runtime.
-        assert itx.guild
-        vc = itx.guild.voice_client
-        assert isinstance(vc, MusicPlayer | None)
+        vc = _get_player(itx)
 
         if vc:
-            if vc.queue:
-                vc.queue.clear()
-                await itx.response.send_message("Queue cleared.")
+            queue = vc.queue
+            if queue:
+                queue.clear()
+                await itx.followup.send("Queue cleared.")
             else:
-                await itx.response.send_message("The queue is already empty.")
+                await itx.followup.send("The queue is already empty.")
         else:
-            await itx.response.send_message("No player to perform this on.")
+            await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="move")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_move(itx: discord.Interaction[MusicBot], before: int, after: int) -> None:
     """Move a track from one spot to another within the queue.
 
@@ -291,27 +415,25 @@ async def muse_move(itx: discord.Interaction[MusicBot], before: int, after: int)
         The index you want to move it to.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        try:
-            temp = vc.queue[before - 1]
-            del vc.queue[before - 1]
-            vc.queue.put_at(after - 1, temp)
-        except IndexError:
-            await itx.response.send_message("Please enter valid queue indices.")
-        else:
-            await itx.response.send_message(f"Successfully moved the track at {before} to {after} in the queue.")
+        queue = vc.queue
+        queue_length = len(queue)
+        if not (1 <= before <= queue_length and 1 <= after <= queue_length):
+            await itx.followup.send("Please enter valid queue indices.")
+            return
+
+        queue.move(before - 1, after - 1)
+        await itx.followup.send(f"Successfully moved the track at {before} to {after} in the queue.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="skip")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_skip(itx: discord.Interaction[MusicBot], index: int = 1) -> None:
     """Skip to the numbered track in the queue. If no number is given, skip to the next track.
 
@@ -323,52 +445,52 @@ async def muse_skip(itx: discord.Interaction[MusicBot], index: int = 1) -> None:
         The place in the queue to skip to.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        if not vc.queue:
-            await itx.response.send_message("The queue is empty and can't be skipped into.")
+        queue = vc.queue
+        if not queue:
+            await itx.followup.send("The queue is empty and can't be skipped into.")
             return
 
-        if index <= 0 or index > len(vc.queue):
-            await itx.response.send_message("Please enter a valid queue index; the given one is too big or too small.")
+        if index <= 0 or index > len(queue):
+            await itx.followup.send("Please enter a valid queue index; the given one is too big or too small.")
             return
 
-        for _ in range(index):
-            await vc.skip()
+        # Drop the skipped-over entries in-process, then advance once. One round trip to the node instead of
+        # one per skipped track.
+        queue.skip_to(index - 1)
+        await vc.skip()
 
-        await itx.response.send_message(f"Skipped to the track at position {index}")
+        await itx.followup.send(f"Skipped to the track at position {index}")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="shuffle")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_shuffle(itx: discord.Interaction[MusicBot]) -> None:
     """Shuffle the tracks in the queue."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        if vc.queue:
-            vc.queue.shuffle()
-            await itx.response.send_message("Shuffled the queue.")
+        queue = vc.queue
+        if queue:
+            queue.shuffle()
+            await itx.followup.send("Shuffled the queue.")
         else:
-            await itx.response.send_message("There's nothing in the queue to shuffle right now.")
+            await itx.followup.send("There's nothing in the queue to shuffle right now.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="loop")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_loop(
     itx: discord.Interaction[MusicBot],
     loop: Literal["All Tracks", "Current Track", "Off"] = "Off",
@@ -384,28 +506,20 @@ async def muse_loop(
         "Off" resets all looping.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        if loop == "All Tracks":
-            vc.queue.mode = wavelink.QueueMode.loop
-            await itx.response.send_message("Looping over all tracks in the queue until disabled.")
-        elif loop == "Current Track":
-            vc.queue.mode = wavelink.QueueMode.loop_all
-            await itx.response.send_message("Looping the current track until disabled.")
-        else:
-            vc.queue.mode = wavelink.QueueMode.normal
-            await itx.response.send_message("Reset the looping settings.")
+        mode, message = _LOOP_MODES[loop]
+        vc.queue.mode = mode
+        await itx.followup.send(message)
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="seek")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_seek(itx: discord.Interaction[MusicBot], position: ShortTime) -> None:
     """Seek to a particular position in the current track, provided with a `hours:minutes:seconds` string.
 
@@ -417,30 +531,29 @@ async def muse_seek(itx: discord.Interaction[MusicBot], position: ShortTime) ->
         The time to jump to, given in a format like `<hours>:<minutes>:<seconds>` or `<minutes>:<seconds>`.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        if vc.current:
-            if vc.current.is_seekable:
-                if position.seconds > vc.current.length or position.seconds < 0:
-                    await itx.response.send_message("The track length doesn't support that position.")
+        current = vc.current
+        if current:
+            if current.is_seekable:
+                if position.seconds > current.length or position.seconds < 0:
+                    await itx.followup.send("The track length doesn't support that position.")
                 else:
                     await vc.seek(position.seconds)
-                    await itx.response.send_message(f"Jumped to position `{position.original}` in the current track.")
+                    await itx.followup.send(f"Jumped to position `{position.original}` in the current track.")
             else:
-                await itx.response.send_message("This track doesn't allow seeking, sorry.")
+                await itx.followup.send("This track doesn't allow seeking, sorry.")
         else:
-            await itx.response.send_message("No track currently playing to seek within.")
+            await itx.followup.send("No track currently playing to seek within.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="volume")
 @app_commands.guild_only()
 @is_in_bot_vc()
+@defer_first
 async def muse_volume(itx: discord.Interaction[MusicBot], volume: int | None = None) -> None:
     """Show the player's volume. If given a number, you can change it as well, with 1000 as the limit.
 
@@ -452,19 +565,16 @@ async def muse_volume(itx: discord.Interaction[MusicBot], volume: int | None = N
         The volume to change to, with a maximum of 1000.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
         if volume is None:
-            await itx.response.send_message(f"Current volume is {vc.volume}.")
+            await itx.followup.send(f"Current volume is {vc.volume}.")
         else:
             await vc.set_volume(volume)
-            await itx.response.send_message(f"Changed volume to {volume}.")
+            await itx.followup.send(f"Changed volume to {volume}.")
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="export")
@@ -473,14 +583,15 @@ async def muse_volume(itx: discord.Interaction[MusicBot], volume: int | None = N
 async def muse_export(itx: discord.Interaction[MusicBot]) -> None:
     """Export the current queue to a file. Can be re-imported later to recreate the queue."""
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        raw_data = [track.raw_data for track in vc.queue]
-        data_buffer = BytesIO(json.dumps(raw_data).encode())
+        # Stream the encoded chunks straight into the buffer instead of materializing the full list and
+        # its JSON string first; for large queues that halves the transient memory of the export.
+        data_buffer = BytesIO()
+        for chunk in json.JSONEncoder().iterencode([track.raw_data for track in vc.queue]):
+            data_buffer.write(chunk.encode())
+        data_buffer.seek(0)
         file = discord.File(
             data_buffer,
             filename=f"music_queue_export_{discord.utils.utcnow(): %Y-%m-%d_%H-%M}.json",
@@ -489,7 +600,7 @@ async def muse_export(itx: discord.Interaction[MusicBot]) -> None:
         )
         await itx.response.send_message("Exported current queue to file:", file=file)
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.response.send_message(_NO_PLAYER_MSG)
 
 
 @app_commands.command(name="import")
@@ -506,33 +617,35 @@ async def muse_import(itx: discord.Interaction[MusicBot], import_file: discord.A
         A JSON file with track information to recreate the queue with. May be created by /export.
     """
 
-    # Known at runtime.
-    assert itx.guild
-    vc = itx.guild.voice_client
-    assert isinstance(vc, MusicPlayer | None)
+    vc = _get_player(itx)
 
     if vc:
-        # Depending on the size of the file, this might take some time.
-        await itx.response.defer()
-
+        # The interaction was already deferred by ensure_voice_hook; reading and parsing the file may take a while.
         filename = import_file.filename
         if not filename.endswith(".json"):
             await itx.followup.send("Bad input: Given file must end with .json.")
             return
 
+        # Reject oversized attachments before downloading anything; a legitimate export is nowhere near this.
+        if import_file.size > 5 * 1024 * 1024:
+            await itx.followup.send("Bad input: Given file must be less than 5MB.")
+            return
+
         raw_data = await import_file.read()
-        loaded_data = json.loads(raw_data)
-        converted_tracks = [wavelink.Playable(data) for data in loaded_data]
+        # orjson's JSONDecodeError subclasses the stdlib one, so the error handler below covers both parsers.
+        loaded_data = orjson.loads(raw_data) if (orjson is not None) else json.loads(raw_data)  # type: ignore
+        converted_tracks = list(map(wavelink.Playable, loaded_data))
 
         # Set up the queue now.
-        vc.queue.clear()
-        vc.queue.put(converted_tracks)
+        queue = vc.queue
+        queue.clear()
+        queue.put(converted_tracks)
 
         await itx.followup.send(f"Imported track information from `{filename}`. Starting queue now.")
         if not vc.playing:
-            await vc.play(vc.queue.get())
+            await vc.play(queue.get())
     else:
-        await itx.response.send_message("No player to perform this on.")
+        await itx.followup.send(_NO_PLAYER_MSG)
 
 
 @muse_import.error  # pyright: ignore [reportUnknownMemberType] # Bug in discord.py.
@@ -554,6 +667,41 @@ async def muse_import_error(itx: discord.Interaction[MusicBot], error: discord.a
         await itx.followup.send(error_text)
 
 
+async def _build_help_embed(client: MusicBot) -> discord.Embed:
+    """Walk the command tree once and assemble the overview embed that /help reuses."""
+
+    help_embed = discord.Embed(title="Help")
+
+    tree = client.tree
+    commands = list(tree.walk_commands())
+
+    # Warm the global command cache with one request; otherwise every concurrent mention lookup below
+    # misses it and issues its own fetch_commands call.
+    if None not in tree.application_commands:
+        await tree.fetch_commands()
+
+    # Group mentions are plain strings; only actual commands need the async mention lookup, and those can all
+    # be resolved concurrently instead of one round trip at a time.
+    app_cmds = [cmd for cmd in commands if isinstance(cmd, app_commands.Command)]
+    gathered_mentions = await asyncio.gather(*(tree.find_mention_for(cmd) for cmd in app_cmds))
+    mentions = dict(zip(app_cmds, gathered_mentions, strict=True))
+
+    for cmd in commands:
+        if isinstance(cmd, app_commands.Command):
+            mention = mentions[cmd]
+            description = cmd.callback.__doc__ or cmd.description
+        else:
+            mention = f"/{cmd.name}"
+            description = cmd.__doc__ or cmd.description
+
+        # Cut off the docstring before any parameter documentation.
+        description = description.partition("Parameters")[0]
+
+        help_embed.add_field(name=mention, value=description, inline=False)
+
+    return help_embed
+
+
 @app_commands.command(name="help")
 async def _help(itx: discord.Interaction[MusicBot], ephemeral: bool = True) -> None:
     """See a brief overview of all the bot's available commands.
@@ -566,43 +714,39 @@ async def _help(itx: discord.Interaction[MusicBot], ephemeral: bool = True) -> N
         Whether the output should be visible to only you. Defaults to True.
     """
 
-    help_embed = discord.Embed(title="Help")
+    # The embed is cached on the tree, whose command set is fixed after setup_hook.
+    tree = itx.client.tree
+    if tree.help_embed is None:
+        tree.help_embed = await _build_help_embed(itx.client)
 
-    for cmd in itx.client.tree.walk_commands():
-        if isinstance(cmd, app_commands.Command):
-            mention = await itx.client.tree.find_mention_for(cmd)
-            description = cmd.callback.__doc__ or cmd.description
-        else:
-            mention = f"/{cmd.name}"
-            description = cmd.__doc__ or cmd.description
+    await itx.response.send_message(embed=tree.help_embed, ephemeral=ephemeral)
 
-        try:
-            index = description.index("Parameters")
-        except ValueError:
-            pass
-        else:
-            description = description[:index]
 
-        help_embed.add_field(name=mention, value=description, inline=False)
+def get_app_commands() -> tuple[app_commands.Command[Any, ..., None] | app_commands.Group, ...]:
+    """Get all of the commands meant to be added to the bot's command tree.
+
+    The queue group is instantiated here rather than at import time, so importing this module for tooling
+    doesn't pay for building it.
+    """
 
-    await itx.response.send_message(embed=help_embed, ephemeral=ephemeral)
-
-
-APP_COMMANDS: list[app_commands.Command[Any, ..., None] | app_commands.Group] = [
-    muse_connect,
-    muse_play,
-    muse_pause,
-    muse_resume,
-    muse_stop,
-    muse_current,
-    MuseQueueGroup(),
-    muse_move,
-    muse_skip,
-    muse_shuffle,
-    muse_loop,
-    muse_seek,
-    muse_volume,
-    _help,
-    muse_export,
-    muse_import,
-]
+    # The explicit annotation keeps the elements known under pyright; the command decorator can't solve
+    # GroupT for module-level commands, so a bare tuple literal would be partially unknown.
+    all_commands: list[app_commands.Command[Any, ..., None] | app_commands.Group] = [
+        muse_connect,
+        muse_play,
+        muse_pause,
+        muse_resume,
+        muse_stop,
+        muse_current,
+        MuseQueueGroup(),
+        muse_move,
+        muse_skip,
+        muse_shuffle,
+        muse_loop,
+        muse_seek,
+        muse_volume,
+        _help,
+        muse_export,
+        muse_import,
+    ]
+    return tuple(all_commands)
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import functools
+import re
 from collections.abc import Callable, Coroutine
-from datetime import timedelta
 from pathlib import Path
-from typing import Any, Concatenate, NamedTuple, ParamSpec, Self, TypeVar
+from typing import Any, ClassVar, Concatenate, NamedTuple, ParamSpec, Self, TypeVar
 
 import discord
 import wavelink
@@ -22,6 +22,7 @@ __all__ = (
     "InvalidShortTimeFormat",
     "LavalinkCreds",
     "ShortTime",
+    "MusicQueue",
     "MusicPlayer",
     "MusicQueueView",
     "resolve_path_with_links",
@@ -30,7 +31,19 @@ __all__ = (
     "is_in_bot_vc",
 )
 
-escape_markdown = functools.partial(discord.utils.escape_markdown, as_needed=True)
+# One C-level translate pass beats discord.py's regex substitution for this small fixed character set.
+_MD_TRANS = str.maketrans({char: f"\\{char}" for char in r"\*_~|`>[]()"})
+
+# Most track titles and authors contain no markdown at all; one regex scan settles that without building
+# a new string.
+_MD_SEARCH = re.compile(r"[\\*_~|`>\[\]()]").search
+
+
+def escape_markdown(content: str) -> str:
+    """Escape markdown metacharacters in a string, returning markdown-free strings untouched."""
+
+    return content if _MD_SEARCH(content) is None else content.translate(_MD_TRANS)
+
 
 MUSIC_EMOJIS = {
     "youtube": "<:youtube:1108460195270631537>",
@@ -40,9 +53,9 @@ MUSIC_EMOJIS = {
     "applemusic": "<:apple_music:1190108916739219466>",
 }
 
-
-def get_track_icon(track: wavelink.Playable) -> str:
-    return MUSIC_EMOJIS.get(track.source, "\N{MUSICAL NOTE}")
+# Icon-plus-separator prefixes for queue page lines, saving one string concat per rendered track.
+_ICON_PREFIXES = {source: f"{emoji} " for source, emoji in MUSIC_EMOJIS.items()}
+_DEFAULT_ICON_PREFIX = "\N{MUSICAL NOTE} "
 
 
 class MusicBotError(Exception):
@@ -93,6 +106,10 @@ class LavalinkCreds(NamedTuple):
     password: str
 
 
+# Matches `<hours>:<minutes>:<seconds>`, `<minutes>:<seconds>`, or `<seconds>`, with an optional fraction.
+_SHORT_TIME_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+)(?:\.(\d+))?")
+
+
 class ShortTime(NamedTuple):
     """A tuple meant to hold the string representation of a time and the total number of seconds it represents."""
 
@@ -101,13 +118,68 @@ class ShortTime(NamedTuple):
 
     @classmethod
     async def transform(cls: type[Self], _: discord.Interaction, position_str: str, /) -> Self:
-        try:
-            zipped_time_segments = zip((1, 60, 3600, 86400), reversed(position_str.split(":")), strict=False)
-            position_seconds = int(sum(x * float(t) for x, t in zipped_time_segments) * 1000)
-        except ValueError:
-            raise InvalidShortTimeFormat(position_str) from None
-        else:
-            return cls(position_str, position_seconds)
+        match = _SHORT_TIME_RE.fullmatch(position_str)
+        if match is None:
+            raise InvalidShortTimeFormat(position_str)
+
+        # Pure integer arithmetic: no float parsing or rounding on the way to milliseconds.
+        hours, minutes, seconds, fraction = match.groups()
+        position_ms = (int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds)) * 1000
+        if fraction:
+            position_ms += int(fraction[:3].ljust(3, "0"))
+        return cls(position_str, position_ms)
+
+
+class MusicQueue(wavelink.Queue):
+    """A version of wavelink.Queue with extra operations.
+
+    The additions manipulate the list backing the queue directly, the same way the base class's synchronous
+    methods do.
+    """
+
+    def _check_indices(self, *indices: int) -> None:
+        """Validate queue indices in one pass, computing the queue length only once.
+
+        Raises
+        ------
+        IndexError
+            One of the given indices is out of range.
+        """
+
+        length = len(self._items)
+        for index in indices:
+            if not 0 <= index < length:
+                msg = f"Queue index {index} is out of range."
+                raise IndexError(msg)
+
+    def move(self, before: int, after: int) -> None:
+        """Move the track at one index to another, shifting everything in between over by one.
+
+        This is a single pop-and-insert on the backing list rather than a separate deletion and insertion.
+
+        Raises
+        ------
+        IndexError
+            One of the given indices is out of range.
+        """
+
+        self._check_indices(before, after)
+        items = self._items
+        items.insert(after, items.pop(before))
+
+    def skip_to(self, index: int) -> None:
+        """Drop every track before the given index, so the next retrieval starts there.
+
+        This is one slice deletion on the backing list instead of a get() call per skipped track.
+
+        Raises
+        ------
+        IndexError
+            The given index is out of range.
+        """
+
+        self._check_indices(index)
+        del self._items[:index]
 
 
 class MusicPlayer(wavelink.Player):
@@ -122,6 +194,8 @@ class MusicPlayer(wavelink.Player):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, *kwargs)
         self.autoplay = wavelink.AutoPlayMode.partial
+        # Deliberately narrows the base class's mutable attribute; nothing assigns a plain Queue back to a player.
+        self.queue: MusicQueue = MusicQueue()  # pyright: ignore [reportIncompatibleVariableOverride]
 
 
 class PageNumEntryModal(discord.ui.Modal):
@@ -152,6 +226,32 @@ class PageNumEntryModal(discord.ui.Modal):
         self.interaction = interaction
 
 
+class _ViewTimeoutBatcher:
+    """Batches messages from expired views briefly, so simultaneous timeouts share one gather of edits
+    instead of each issuing its own HTTP request the moment it fires.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[discord.Message] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def schedule(self, message: discord.Message) -> None:
+        self._pending.append(message)
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(2.0)
+        self._flush_task = None
+        batch = self._pending.copy()
+        self._pending.clear()
+        # Some messages may be gone by now; one failed edit shouldn't strand the rest of the batch.
+        await asyncio.gather(*(message.edit(view=None) for message in batch), return_exceptions=True)
+
+
+_timeout_batcher = _ViewTimeoutBatcher()
+
+
 class MusicQueueView(discord.ui.View):
     """A view that handles paginated embeds and page buttons for seeing the tracks in an embed-based music queue.
 
@@ -173,17 +273,38 @@ class MusicQueueView(discord.ui.View):
         The message to which the view is attached to, allowing interaction without a discord.Interaction.
     author_id: int
         The Discord ID of the user that triggered this view. No one else can use it.
-    per_page: int
-        The number of entries to be displayed per page.
-    pages : list[wavelink.Playable]
-        A list of content for pages, split according to how much content is wanted per page.
     page_index: int
         The index for the current page.
-    total_pages
+    total_pages: int
+        The total number of pages.
     """
 
     message: discord.Message
 
+    # Button layouts bucketed by page count (0-1, 2, and 3+ pages), so instantiation picks a layout with
+    # one lookup instead of re-deriving it from branches.
+    _LAYOUTS: ClassVar[dict[int, tuple[str, ...]]] = {
+        0: ("quit_view",),
+        1: ("quit_view",),
+        2: ("turn_to_previous", "turn_to_next", "quit_view"),
+        3: ("turn_to_first", "turn_to_previous", "enter_page", "turn_to_next", "turn_to_last", "quit_view"),
+    }
+
+    # Disabled bits for (first, previous, enter, next, last), keyed by (one page or fewer, at the first
+    # page, at the last page). Page flips become one lookup instead of a branch tree.
+    _DISABLE_STATES: ClassVar[dict[tuple[bool, bool, bool], tuple[bool, bool, bool, bool, bool]]] = {
+        (single, at_first, at_last): (
+            single or at_first,
+            single or at_first,
+            single,
+            single or at_last,
+            single or at_last,
+        )
+        for single in (True, False)
+        for at_first in (True, False)
+        for at_last in (True, False)
+    }
+
     def __init__(
         self,
         author_id: int,
@@ -194,18 +315,36 @@ class MusicQueueView(discord.ui.View):
     ) -> None:
         super().__init__(timeout=timeout)
         self.author_id = author_id
-        self.pages = [pages_content[i : (i + per)] for i in range(0, len(pages_content), per)]
+        # Keep the single backing list and slice out pages on demand; only one page is ever rendered at a time.
+        self._content = pages_content
+        self._per = per
+        # The content never changes after construction, so the page count is a plain attribute rather than
+        # a property recomputed on every read.
+        self.total_pages: int = -(-len(pages_content) // per)
         self.page_index: int = 1
+        # Every page shares the same color and title; copying this template skips Embed's kwarg parsing.
+        self._embed_template = discord.Embed(color=0x149CDF, title="Music Queue")
+        # Serialized component payloads keyed by page state; must exist before the clear_items call below.
+        self._components_cache: dict[tuple[int, int], list[dict[str, Any]]] = {}
 
         # Activate the right buttons on instantiation.
         self.clear_items().add_page_buttons()
         self.disable_page_buttons()
 
-    @property
-    def total_pages(self) -> int:
-        """int: The total number of pages."""
+    def clear_items(self) -> Self:
+        """Removes all items from the view, invalidating any cached component payloads."""
 
-        return len(self.pages)
+        self._components_cache.clear()
+        return super().clear_items()
+
+    def to_components(self) -> list[dict[str, Any]]:
+        # The payload depends only on the page position, and a view has finitely many of those; serialize
+        # each state once and reuse it across page flips.
+        key = (self.total_pages, self.page_index)
+        components = self._components_cache.get(key)
+        if components is None:
+            components = self._components_cache[key] = super().to_components()
+        return components
 
     async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
         """Ensures that the user interacting with the view was the one who instantiated it."""
@@ -216,10 +355,10 @@ class MusicQueueView(discord.ui.View):
         return check
 
     async def on_timeout(self) -> None:
-        """Removes all buttons when the view times out."""
+        """Removes all buttons when the view times out, batching the edit with other expiring views."""
 
         self.clear_items()
-        await self.message.edit(view=self)
+        _timeout_batcher.schedule(self.message)
         self.stop()
 
     def add_page_buttons(self) -> Self:
@@ -228,48 +367,42 @@ class MusicQueueView(discord.ui.View):
         This function returns the class instance to allow for fluent-style chaining.
         """
 
-        if self.total_pages > 2:
-            (
-                self.add_item(self.turn_to_first)
-                .add_item(self.turn_to_previous)
-                .add_item(self.enter_page)
-                .add_item(self.turn_to_next)
-                .add_item(self.turn_to_last)
-            )
-        elif self.total_pages > 1:
-            self.add_item(self.turn_to_previous).add_item(self.turn_to_next)
-
-        self.add_item(self.quit_view)
+        add_item = self.add_item
+        for name in self._LAYOUTS[min(self.total_pages, 3)]:
+            add_item(getattr(self, name))
 
         return self
 
     def disable_page_buttons(self) -> None:
         """Enables and disables page-turning buttons based on page count, position, and movement."""
 
-        if self.total_pages <= 1:
-            self.turn_to_next.disabled = self.turn_to_last.disabled = True
-            self.turn_to_previous.disabled = self.turn_to_first.disabled = True
-            self.enter_page.disabled = True
-        else:
-            self.turn_to_previous.disabled = self.turn_to_first.disabled = self.page_index == 0
-            self.turn_to_next.disabled = self.turn_to_last.disabled = self.page_index == self.total_pages - 1
-            self.enter_page.disabled = False
+        total_pages = self.total_pages
+        state = self._DISABLE_STATES[(total_pages <= 1, self.page_index == 0, self.page_index == total_pages - 1)]
+        (
+            self.turn_to_first.disabled,
+            self.turn_to_previous.disabled,
+            self.enter_page.disabled,
+            self.turn_to_next.disabled,
+            self.turn_to_last.disabled,
+        ) = state
 
     def format_page(self) -> discord.Embed:
         """Makes the embed 'page' that the user will see."""
 
-        embed_page = discord.Embed(color=0x149CDF, title="Music Queue")
+        embed_page = self._embed_template.copy()
 
         if self.total_pages == 0:
             embed_page.description = "The queue is empty."
             embed_page.set_footer(text="Page 0/0")
         else:
-            # Expected page size of 10
-            content = self.pages[self.page_index]
-            organized = (
-                f"{i + (self.page_index) * 10}. {get_track_icon(track)} {track.title}"
+            start = self.page_index * self._per
+            content = self._content[start : start + self._per]
+            # A list comprehension with pre-bound lookups; str.join buffers generators into a list anyway.
+            prefix_get = _ICON_PREFIXES.get
+            organized = [
+                f"{start + i}. {prefix_get(track.source, _DEFAULT_ICON_PREFIX)}{track.title}"
                 for i, track in enumerate(content, 1)
-            )
+            ]
             embed_page.description = "\n".join(organized)
             embed_page.set_footer(text=f"Page {self.page_index + 1}/{self.total_pages}")
 
@@ -287,7 +420,12 @@ class MusicQueueView(discord.ui.View):
     async def update_page(self, interaction: discord.Interaction) -> None:
         """Update and display the view for the given page."""
 
-        embed_page = self.format_page()
+        # Rendering an oversized page (escaping and formatting every line) can hold up the event loop;
+        # push those to a thread and keep the cheap common case synchronous.
+        if self._per > 50:
+            embed_page = await asyncio.get_running_loop().run_in_executor(None, self.format_page)
+        else:
+            embed_page = self.format_page()
         self.disable_page_buttons()
         await interaction.response.edit_message(embed=embed_page, view=self)
 
@@ -319,13 +457,13 @@ class MusicQueueView(discord.ui.View):
 
         assert modal.interaction is not None  # The modal had to be submitted to reach this point.
 
-        # Validate the input.
-        try:
-            temp_new_page = int(modal.input_page_num.value)
-        except ValueError:
+        # Validate the input. isdecimal() rejects bad input (including signs, which int() would accept)
+        # without the exception scaffolding, and guarantees the int() call below succeeds.
+        value = modal.input_page_num.value.strip()
+        if not value.isdecimal():
             return
 
-        temp_new_page -= 1
+        temp_new_page = int(value) - 1
 
         if temp_new_page >= self.total_pages or temp_new_page < 0 or self.page_index == temp_new_page:
             return
@@ -349,11 +487,10 @@ class MusicQueueView(discord.ui.View):
 
     @discord.ui.button(label="\N{MULTIPLICATION X}", style=discord.ButtonStyle.red)
     async def quit_view(self, interaction: discord.Interaction, _: discord.ui.Button[Self]) -> None:
-        """Deletes the original message with the view after a slight delay."""
+        """Deletes the original message with the view."""
 
         self.stop()
         await interaction.response.defer()
-        await asyncio.sleep(0.25)
         await interaction.delete_original_response()
 
 
@@ -368,31 +505,66 @@ def resolve_path_with_links(path: Path, folder: bool = False) -> Path:
     try:
         return path.resolve(strict=True)
     except FileNotFoundError:
-        path = resolve_path_with_links(path.parent, folder=True) / path.name
-        if folder:
-            path.mkdir(mode=0o700)  # python's default is world read/write/traversable... (0o777)
-        else:
-            path.touch(mode=0o600)  # python's default is world read/writable... (0o666)
-        return path.resolve(strict=True)
+        pass
+
+    # Walk up to the deepest existing ancestor, then create the missing pieces top-down. One pass and one
+    # final strict resolve, instead of recursing with a full resolve at every level.
+    missing: list[Path] = []
+    current = path
+    while not current.exists():
+        missing.append(current)
+        current = current.parent
+
+    for ancestor in reversed(missing[1:]):
+        ancestor.mkdir(mode=0o700)  # python's default is world read/write/traversable... (0o777)
+    if folder:
+        path.mkdir(mode=0o700)
+    else:
+        path.touch(mode=0o600)  # python's default is world read/writable... (0o666)
+    return path.resolve(strict=True)
+
+
+@functools.lru_cache(maxsize=256)
+def _track_embed_parts(fields: tuple[str, str, str, str, str, int]) -> tuple[str, str]:
+    """Build the title and description strings for a track embed, memoized on the track's display fields.
+
+    The fields tuple — (title, source, uri, author, track title, length) — doubles as the cache key. Repeat
+    displays of the same track — loops, autoplay, queue refreshes — skip the markdown escaping and duration
+    formatting entirely.
+    """
 
+    title, source, uri, author, track_title, length = fields
 
-def create_track_embed(title: str, track: wavelink.Playable) -> discord.Embed:
-    """Modify an embed to show information about a Wavelink track."""
-
-    icon = get_track_icon(track)
-    title = f"{icon} {title}"
-    uri = track.uri or ""
-    author = escape_markdown(track.author)
-    track_title = escape_markdown(track.title)
+    icon = MUSIC_EMOJIS.get(source, "\N{MUSICAL NOTE}")
+    author = escape_markdown(author)
+    track_title = escape_markdown(track_title)
 
-    try:
-        end_time = timedelta(seconds=track.length // 1000)
-    except OverflowError:
+    # Plain integer divmods instead of a timedelta allocation and its __str__; anything implausibly long
+    # (streams report sentinel lengths) renders as infinite.
+    total_seconds = length // 1000
+    if total_seconds >= 86_400 * 365:
         end_time = "\N{INFINITY}"
+    else:
+        hours, rem = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(rem, 60)
+        end_time = f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    return f"{icon} {title}", f"[{track_title}]({uri})\n{author}\n`[0:00-{end_time}]`"
 
-    description = f"[{track_title}]({uri})\n{author}\n`[0:00-{end_time}]`"
 
-    embed = discord.Embed(color=0x76C3A2, title=title, description=description)
+# Pre-bound to skip the module attribute lookup each time a track embed is built.
+_Embed = discord.Embed
+
+
+def create_track_embed(title: str, track: wavelink.Playable) -> discord.Embed:
+    """Modify an embed to show information about a Wavelink track."""
+
+    embed_title, description = _track_embed_parts(
+        (title, track.source, track.uri or "", track.author, track.title, track.length)
+    )
+
+    # The embed itself is built fresh per call since callers may mutate it and the fields below vary.
+    embed = _Embed(color=0x76C3A2, title=embed_title, description=description)
 
     if track.artwork:
         embed.set_thumbnail(url=track.artwork)
@@ -400,7 +572,14 @@ def create_track_embed(title: str, track: wavelink.Playable) -> discord.Embed:
     if track.album.name:
         embed.add_field(name="Album", value=track.album.name)
 
-    if requester := getattr(track.extras, "requester", None):
+    # Nearly every displayed track was queued by someone, so read the attribute directly and treat a miss
+    # (e.g. tracks recreated by /import) as the exceptional path.
+    try:
+        requester = track.extras.requester
+    except AttributeError:
+        requester = None
+
+    if requester:
         embed.add_field(name="Requested By", value=requester)
 
     return embed
@@ -409,7 +588,7 @@ def create_track_embed(title: str, track: wavelink.Playable) -> discord.Embed:
 def ensure_voice_hook(func: UnboundCommandCallback[P, T]) -> UnboundCommandCallback[P, T]:
     """A makeshift pre-command hook, ensuring that a voice client automatically connects the right channel.
 
-    This is currently only used for /muse_play.
+    The hook also defers the interaction before doing anything slow, so wrapped commands must respond via followups.
 
     Raises
     ------
@@ -423,15 +602,24 @@ def ensure_voice_hook(func: UnboundCommandCallback[P, T]) -> UnboundCommandCallb
         assert itx.guild
         assert isinstance(itx.user, discord.Member)
         vc = itx.guild.voice_client
-        assert isinstance(vc, MusicPlayer | None)
+        # Exact type check: the bot only ever connects with cls=MusicPlayer, and a union isinstance builds
+        # and walks a types.UnionType on every invocation.
+        assert vc is None or type(vc) is MusicPlayer
+
+        # Reject synchronously before any awaits so refused commands don't pay for a defer or a loop tick.
+        user_voice = itx.user.voice
+        if vc is None and user_voice is None:
+            raise NotInVoiceChannel
+
+        # Acknowledge the interaction up front: connecting to voice and the search/queue work in the wrapped
+        # command can easily exceed Discord's 3 second response window.
+        await itx.response.defer()
 
         if vc is None:
-            if itx.user.voice:
-                # Not sure in what circumstances a member would have a voice state without being in a valid channel.
-                assert itx.user.voice.channel
-                await itx.user.voice.channel.connect(cls=MusicPlayer)
-            else:
-                raise NotInVoiceChannel
+            assert user_voice is not None
+            # Not sure in what circumstances a member would have a voice state without being in a valid channel.
+            assert user_voice.channel
+            await user_voice.channel.connect(cls=MusicPlayer)
         return await func(itx, *args, **kwargs)
 
     return callback
@@ -454,13 +642,15 @@ def is_in_bot_vc() -> Callable[[T], T]:
         if not itx.guild or not isinstance(itx.user, discord.Member):
             raise discord.app_commands.NoPrivateMessage
 
+        # Check channel membership first: it's a few attribute reads, while guild_permissions resolves the
+        # member's full role set. The common case — a non-admin in the right channel — never pays for that.
         vc = itx.guild.voice_client
+        user_voice = itx.user.voice
 
-        if not (
-            itx.user.guild_permissions.administrator
-            or (vc and itx.user.voice and (itx.user.voice.channel == vc.channel))
-        ):
-            raise NotInBotVoiceChannel
-        return True
+        if vc is not None and user_voice is not None and user_voice.channel == vc.channel:
+            return True
+        if itx.user.guild_permissions.administrator:
+            return True
+        raise NotInBotVoiceChannel
 
     return discord.app_commands.check(predicate)